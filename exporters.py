@@ -1,4 +1,7 @@
 from pathlib import Path
+import json
+import sqlite3
+import numpy as np
 import pandas as pd
 from openpyxl import load_workbook, Workbook
 from openpyxl.utils import get_column_letter
@@ -215,3 +218,224 @@ def save_point_kmz(lat, lon, name, description, out_path):
     with ZipFile(out, "w", compression=ZIP_DEFLATED) as zf:
         zf.writestr("doc.kml", xml.encode("utf-8"))
     return str(out)
+
+
+# ------------------ Spatial: multi-layer GeoJSON / GeoPackage ------------------ #
+
+SPATIAL_BATCH_SIZE = 5000  # features per write / per GeoPackage transaction
+WGS84_SRS_ID = 4326
+
+SPATIAL_LAYERS = ("observations", "photos")
+
+PHOTO_LAYER_COLUMNS = [
+    "source_file", "seqno", "observer", "event_timestamp",
+    "photo_index", "photoname", "photolat", "photolon", "photoacc", "photodir",
+]
+
+# GeoPackage geometry blob for a 2D point: "GP" header (little-endian, no
+# envelope) followed by a little-endian WKB Point. 29 bytes, no padding.
+_GPKG_POINT_DTYPE = np.dtype([
+    ("magic", "S2"),
+    ("version", "u1"),
+    ("flags", "u1"),
+    ("srs_id", "<i4"),
+    ("byte_order", "u1"),
+    ("wkb_type", "<u4"),
+    ("x", "<f8"),
+    ("y", "<f8"),
+])
+
+_WGS84_WKT = (
+    'GEOGCS["WGS 84",DATUM["WGS_1984",SPHEROID["WGS 84",6378137,298.257223563,'
+    'AUTHORITY["EPSG","7030"]],AUTHORITY["EPSG","6326"]],PRIMEM["Greenwich",0,'
+    'AUTHORITY["EPSG","8901"]],UNIT["degree",0.0174532925199433,'
+    'AUTHORITY["EPSG","9122"]],AUTHORITY["EPSG","4326"]]'
+)
+
+
+def _point_layer(df, lat_col, lon_col):
+    """
+    Return (props, x, y) for rows of `df` with a usable WGS84 point.
+    Coordinates are parsed column-wise; rows with missing/out-of-range values are dropped.
+    """
+    if df.empty or lat_col not in df or lon_col not in df:
+        return df.iloc[0:0], np.empty(0), np.empty(0)
+    x = pd.to_numeric(df[lon_col], errors="coerce")
+    y = pd.to_numeric(df[lat_col], errors="coerce")
+    ok = (x.between(-180, 180) & y.between(-90, 90)).to_numpy()
+    props = df.loc[ok].reset_index(drop=True)
+    text_cols = props.select_dtypes(include="object").columns
+    props[text_cols] = props[text_cols].fillna("")
+    return props, x.to_numpy()[ok], y.to_numpy()[ok]
+
+
+def _observation_layer(observation_rows):
+    df = pd.DataFrame([{k: v for k, v in r.items() if k != "photos"} for r in observation_rows])
+    return _point_layer(df, "lat", "lon")
+
+
+def _photo_layer(observation_rows):
+    photos_rows = []
+    for r in observation_rows:
+        for i, p in enumerate(r.get("photos", []) or [], start=1):
+            photos_rows.append({
+                "source_file": r.get("source_file", ""),
+                "seqno": r.get("seqno", ""),
+                "observer": r.get("observer", ""),
+                "event_timestamp": r.get("event_timestamp", ""),
+                "photo_index": i,
+                "photoname": p.get("photoname", ""),
+                "photolat": p.get("photolat", ""),
+                "photolon": p.get("photolon", ""),
+                "photoacc": p.get("photoacc", ""),
+                "photodir": p.get("photodir", ""),
+            })
+    df = pd.DataFrame(photos_rows, columns=PHOTO_LAYER_COLUMNS)
+    return _point_layer(df, "photolat", "photolon")
+
+
+def _spatial_layer(observation_rows, layer):
+    if layer == "observations":
+        return _observation_layer(observation_rows)
+    if layer == "photos":
+        return _photo_layer(observation_rows)
+    raise ValueError(f"Unknown layer {layer!r}; expected one of {SPATIAL_LAYERS}")
+
+
+def to_geojsonseq(observation_rows, out_path, layer="observations"):
+    """
+    Newline-delimited GeoJSON (one Feature per line) for one layer:
+    'observations' (lat/lon) or 'photos' (photolat/photolon).
+    """
+    props, x, y = _spatial_layer(observation_rows, layer)
+    # Geometry text is built for the whole layer at once; only properties are per-feature.
+    geoms = (
+        '{"type":"Feature","geometry":{"type":"Point","coordinates":['
+        + pd.Series(x, dtype="float64").astype(str) + ","
+        + pd.Series(y, dtype="float64").astype(str)
+        + ']},"properties":'
+    ).tolist()
+    records = props.to_dict("records")
+
+    out = Path(out_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with out.open("w", encoding="utf-8", newline="\n") as fh:
+        for start in range(0, len(records), SPATIAL_BATCH_SIZE):
+            stop = start + SPATIAL_BATCH_SIZE
+            fh.write("".join(
+                g + json.dumps(p, ensure_ascii=False) + "}\n"
+                for g, p in zip(geoms[start:stop], records[start:stop])
+            ))
+    return str(out)
+
+
+def _gpkg_point_blobs(x, y, srs_id=WGS84_SRS_ID):
+    arr = np.zeros(len(x), dtype=_GPKG_POINT_DTYPE)
+    arr["magic"] = b"GP"
+    arr["flags"] = 0x01  # little-endian header, no envelope
+    arr["srs_id"] = srs_id
+    arr["byte_order"] = 1
+    arr["wkb_type"] = 1  # Point
+    arr["x"] = x
+    arr["y"] = y
+    raw = arr.tobytes()
+    size = arr.itemsize
+    return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+
+def _gpkg_column_type(series):
+    if pd.api.types.is_integer_dtype(series):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(series):
+        return "REAL"
+    return "TEXT"
+
+
+def _gpkg_init(con):
+    con.executescript(f"""
+        PRAGMA application_id = 1196444487;
+        PRAGMA user_version = 10300;
+        CREATE TABLE gpkg_spatial_ref_sys (
+            srs_name TEXT NOT NULL,
+            srs_id INTEGER PRIMARY KEY,
+            organization TEXT NOT NULL,
+            organization_coordsys_id INTEGER NOT NULL,
+            definition TEXT NOT NULL,
+            description TEXT
+        );
+        CREATE TABLE gpkg_contents (
+            table_name TEXT NOT NULL PRIMARY KEY,
+            data_type TEXT NOT NULL,
+            identifier TEXT UNIQUE,
+            description TEXT DEFAULT '',
+            last_change DATETIME NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+            min_x DOUBLE, min_y DOUBLE, max_x DOUBLE, max_y DOUBLE,
+            srs_id INTEGER REFERENCES gpkg_spatial_ref_sys(srs_id)
+        );
+        CREATE TABLE gpkg_geometry_columns (
+            table_name TEXT NOT NULL UNIQUE REFERENCES gpkg_contents(table_name),
+            column_name TEXT NOT NULL,
+            geometry_type_name TEXT NOT NULL,
+            srs_id INTEGER NOT NULL REFERENCES gpkg_spatial_ref_sys(srs_id),
+            z TINYINT NOT NULL,
+            m TINYINT NOT NULL,
+            PRIMARY KEY (table_name, column_name)
+        );
+        INSERT INTO gpkg_spatial_ref_sys VALUES
+            ('Undefined cartesian SRS', -1, 'NONE', -1, 'undefined', 'undefined cartesian coordinate reference system'),
+            ('Undefined geographic SRS', 0, 'NONE', 0, 'undefined', 'undefined geographic coordinate reference system'),
+            ('WGS 84 geodetic', {WGS84_SRS_ID}, 'EPSG', 4326, '{_WGS84_WKT}', 'longitude/latitude coordinates in decimal degrees on the WGS 84 spheroid');
+    """)
+
+
+def _gpkg_write_layer(con, table, props, x, y):
+    cols = [c for c in props.columns if c.lower() not in ("fid", "geom")]
+    col_defs = "".join(f', "{c}" {_gpkg_column_type(props[c])}' for c in cols)
+    bounds = (x.min(), y.min(), x.max(), y.max()) if len(x) else (None, None, None, None)
+    with con:
+        con.execute(
+            f'CREATE TABLE "{table}" (fid INTEGER PRIMARY KEY AUTOINCREMENT, geom POINT{col_defs})'
+        )
+        con.execute(
+            "INSERT INTO gpkg_contents (table_name, data_type, identifier, min_x, min_y, max_x, max_y, srs_id) "
+            "VALUES (?, 'features', ?, ?, ?, ?, ?, ?)",
+            (table, table, *[None if b is None else float(b) for b in bounds], WGS84_SRS_ID),
+        )
+        con.execute(
+            "INSERT INTO gpkg_geometry_columns VALUES (?, 'geom', 'POINT', ?, 0, 0)",
+            (table, WGS84_SRS_ID),
+        )
+
+    blobs = _gpkg_point_blobs(x, y)
+    values = props[cols].itertuples(index=False, name=None)
+    placeholders = ", ".join("?" * (len(cols) + 1))
+    col_list = "".join(f', "{c}"' for c in cols)
+    sql = f'INSERT INTO "{table}" (geom{col_list}) VALUES ({placeholders})'
+    for start in range(0, len(blobs), SPATIAL_BATCH_SIZE):
+        batch = [
+            (blob, *vals)
+            for blob, vals in zip(blobs[start:start + SPATIAL_BATCH_SIZE], values)
+        ]
+        with con:  # one transaction per batch
+            con.executemany(sql, batch)
+
+
+def to_geopackage(observation_rows, out_path):
+    """
+    GeoPackage with two point layers (EPSG:4326):
+      - observations: one feature per observation with usable lat/lon
+      - photos: one feature per photo with usable photolat/photolon
+    Written with the standard-library sqlite3 module; an existing file is replaced.
+    """
+    out = Path(out_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    if out.exists():
+        out.unlink()
+    con = sqlite3.connect(out)
+    try:
+        _gpkg_init(con)
+        for layer in SPATIAL_LAYERS:
+            _gpkg_write_layer(con, layer, *_spatial_layer(observation_rows, layer))
+    finally:
+        con.close()
+    return str(out)
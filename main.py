@@ -7,6 +7,8 @@ from parser_core import parse_xml_file
 from exporters import (
     to_excel_multisheet,
     to_excel_with_photo_dropdown,
+    to_geojsonseq,
+    to_geopackage,
 )
 
 APP_DIR = Path(__file__).parent.resolve()
@@ -89,6 +91,16 @@ class MainWin(QtWidgets.QMainWindow):
         self.act_export_multi.triggered.connect(self.export_excel_multisheet)
         tb.addAction(self.act_export_multi)
 
+        self.act_export_geojson = QtGui.QAction("Export GeoJSON…", self)
+        self.act_export_geojson.setEnabled(False)
+        self.act_export_geojson.triggered.connect(self.export_geojson)
+        tb.addAction(self.act_export_geojson)
+
+        self.act_export_gpkg = QtGui.QAction("Export GeoPackage…", self)
+        self.act_export_gpkg.setEnabled(False)
+        self.act_export_gpkg.triggered.connect(self.export_geopackage)
+        tb.addAction(self.act_export_gpkg)
+
         self.status = self.statusBar()
 
     # ---------- Load & prepare ----------
@@ -110,6 +122,8 @@ class MainWin(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.information(self, "Parse Result", "No rows found.")
             self.act_export_excel.setEnabled(False)
             self.act_export_multi.setEnabled(False)
+            self.act_export_geojson.setEnabled(False)
+            self.act_export_gpkg.setEnabled(False)
             self.btn_choose_cols.setEnabled(False)
             self._load_table([])
             return
@@ -136,6 +150,8 @@ class MainWin(QtWidgets.QMainWindow):
         self._load_table(self.flat_rows)
         self.act_export_excel.setEnabled(True)
         self.act_export_multi.setEnabled(True)
+        self.act_export_geojson.setEnabled(True)
+        self.act_export_gpkg.setEnabled(True)
         self.btn_choose_cols.setEnabled(True)
 
         msg = f"Parsed {len(self.rows)} row(s)."
@@ -286,6 +302,43 @@ class MainWin(QtWidgets.QMainWindow):
         QtWidgets.QMessageBox.information(self, "Export", f"Saved Excel (multi-sheet) → {path}")
         self.status.showMessage(f"Saved: {path}", 4000)
 
+    # ---------- Spatial export ----------
+    def _rows_for_export(self):
+        selected_rows = sorted({i.row() for i in self.table.selectedIndexes()})
+        if self.chk_only_selected.isChecked() and selected_rows:
+            return [self.rows[i] for i in selected_rows]
+        return self.rows
+
+    def export_geojson(self):
+        if not self.rows:
+            QtWidgets.QMessageBox.warning(self, "Export", "Nothing to export.")
+            return
+        out, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Save GeoJSON (observations)", str(APP_DIR / "observations.geojsonl"),
+            "GeoJSON Lines (*.geojsonl *.geojsons)"
+        )
+        if not out:
+            return
+        rows = self._rows_for_export()
+        obs_path = to_geojsonseq(rows, out, layer="observations")
+        out_p = Path(out)
+        photos_path = to_geojsonseq(rows, out_p.with_name(f"{out_p.stem}_photos{out_p.suffix}"), layer="photos")
+        QtWidgets.QMessageBox.information(self, "Export", f"Saved GeoJSON → {obs_path}\nPhotos → {photos_path}")
+        self.status.showMessage(f"Saved: {obs_path}", 5000)
+
+    def export_geopackage(self):
+        if not self.rows:
+            QtWidgets.QMessageBox.warning(self, "Export", "Nothing to export.")
+            return
+        out, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Save GeoPackage", str(APP_DIR / "export.gpkg"), "GeoPackage (*.gpkg)"
+        )
+        if not out:
+            return
+        path = to_geopackage(self._rows_for_export(), out)
+        QtWidgets.QMessageBox.information(self, "Export", f"Saved GeoPackage → {path}")
+        self.status.showMessage(f"Saved: {path}", 5000)
+
     # ---------- Validation ----------
     def _show_basic_validation(self):
         valid = 0